@@ -8,6 +8,26 @@ import sys
 import jellyplex as jp
 
 
+RADARR_SYNC_EVENTS = ("Download", "Upgrade", "Rename")
+
+
+class EnvDefault(argparse.Action):
+    """Store action whose default is read from an environment variable.
+
+    Options given on the command line are collected in the 'given_options'
+    attribute of the namespace.
+    """
+
+    def __init__(self, envvar: str, default: str | None = None, **kwargs):
+        super().__init__(default=os.environ.get(envvar, default), **kwargs)
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        setattr(namespace, self.dest, values)
+        given_options = getattr(namespace, "given_options", [])
+        given_options.append(option_string)
+        setattr(namespace, "given_options", given_options)
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Create a Plex compatible media library from a Jellyfin library.")
     parser.add_argument("source", help="Jellyfin media library")
@@ -27,12 +47,27 @@ def main() -> None:
         help="Comma-separated list of MergerFS branch paths (e.g., '/mnt/disk1,/mnt/disk2') for branch validation")
     parser.add_argument("--check-colocation", action="store_true",
         help="Verify that source files and target directories are on the same MergerFS branch before syncing")
+    parser.add_argument("--max-workers", type=int, default=1, metavar="N",
+        help="Number of threads processing movies concurrently, with --delete only asset subfolders (default: 1)")
+    parser.add_argument("--skip-unchanged", action="store_true",
+        help="Skip movie folders unchanged since their last successful sync (ignored with --delete, --update-filenames and --verify-only)")
 
     group = parser.add_mutually_exclusive_group()
     group.add_argument("--partial", help="Sync only the specified movie folder path")
     group.add_argument("--radarr-hook", action="store_true", help="Read movie path from Radarr environment variables")
+    parser.add_argument("--radarr-event", action=EnvDefault, envvar="radarr_eventtype",
+        help="Radarr event type for --radarr-hook (default: $radarr_eventtype)")
+    parser.add_argument("--radarr-movie-path", action=EnvDefault, envvar="radarr_movie_path",
+        help="Movie folder for --radarr-hook (default: $radarr_movie_path)")
+    parser.add_argument("--radarr-movie-title", action=EnvDefault, envvar="radarr_movie_title", default="Unknown",
+        help="Movie title for log messages (default: $radarr_movie_title)")
 
     args = parser.parse_args()
+    if args.max_workers < 1:
+        parser.error("--max-workers must be at least 1")
+    given_options = getattr(args, "given_options", [])
+    if given_options and not args.radarr_hook:
+        parser.error(f"{', '.join(given_options)} requires --radarr-hook")
 
     logging.basicConfig(
         level=logging.INFO,
@@ -43,27 +78,24 @@ def main() -> None:
     partial_path = args.partial
 
     if args.radarr_hook:
-        event_type = os.environ.get("radarr_eventtype")
-        if event_type is None:
-            logging.error("radarr_eventtype environment variable not set")
+        if args.radarr_event is None:
+            logging.error("Radarr event type not set (--radarr-event or $radarr_eventtype)")
             sys.exit(1)
 
-        if event_type == "Test":
+        if args.radarr_event == "Test":
             logging.info("Radarr connection test successful")
             sys.exit(0)
 
-        if event_type not in ["Download", "Upgrade", "Rename"]:
-            logging.info(f"Ignoring Radarr event type: {event_type}")
+        if args.radarr_event not in RADARR_SYNC_EVENTS:
+            logging.info(f"Ignoring Radarr event type: {args.radarr_event}")
             sys.exit(0)
 
-        radarr_path = os.environ.get("radarr_movie_path")
-        if not radarr_path:
-            logging.error("radarr_movie_path environment variable not set")
+        if not args.radarr_movie_path:
+            logging.error("Radarr movie path not set (--radarr-movie-path or $radarr_movie_path)")
             sys.exit(1)
 
-        movie_title = os.environ.get("radarr_movie_title", "Unknown")
-        logging.info(f"Radarr hook triggered for movie: {movie_title}")
-        partial_path = radarr_path
+        logging.info(f"Radarr hook triggered for movie: {args.radarr_movie_title}")
+        partial_path = args.radarr_movie_path
 
     # Parse MergerFS branches if provided
     mergerfs_branches = None
@@ -87,6 +119,8 @@ def main() -> None:
             skip_verify=args.skip_verify,
             mergerfs_branches=mergerfs_branches,
             check_colocation=args.check_colocation,
+            max_workers=args.max_workers,
+            skip_unchanged=args.skip_unchanged,
         )
     except KeyboardInterrupt:
         logging.info("INTERRUPTED")
@@ -15,7 +15,7 @@ ACCEPTED_ASSOCIATED_SUFFIXES = {".srt", ".ass", ".ssa", ".sub", ".idx", ".vtt",
 RESOLUTION_PATTERN = re.compile(r"\d{3,4}[pi]$")
 
 
-@dataclass
+@dataclass(slots=True)
 class MovieInfo:
     """Metadata for the whole movie"""
     title: str
@@ -24,7 +24,7 @@ class MovieInfo:
     movie_id: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class VideoInfo:
     """Metadata for a single video file"""
     extension: str
@@ -1,12 +1,16 @@
 import errno
+import functools
 import logging
 import os
 import pathlib
 import re
+import stat
+import threading
+from collections import defaultdict, deque
 from collections.abc import Generator
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from dataclasses import dataclass
-import glob as pyglob
-from typing import Optional
+from typing import NamedTuple, Optional
 
 from .library import (
     ACCEPTED_ASSOCIATED_SUFFIXES,
@@ -23,12 +27,8 @@ from .plex import (
 )
 from . import utils
 
-# Optional xattr support for MergerFS branch detection
-try:
-    import xattr
-    _XATTR_AVAILABLE = True
-except ImportError:
-    _XATTR_AVAILABLE = False
+# Extended attributes for MergerFS branch detection (Linux only)
+_XATTR_AVAILABLE = hasattr(os, "getxattr")
 
 # Configure logging immediately
 logging.basicConfig(
@@ -38,6 +38,17 @@ logging.basicConfig(
 )
 log = logging.getLogger(__name__)
 
+# Markers used by determine_library_type() to guess the library flavour
+# Bracketed markers, classified by the name of the matching group in a single pass
+LIBRARY_HINT_PATTERN = re.compile(
+    r"(?P<jellyfin_id>\[[a-z]+id-[^\]]+\])"
+    r"|(?P<plex_id>\{[a-z]+-[^\}]+\})"
+    r"|(?P<resolution>\[\d{3,4}[pi]\])"
+    r"|(?P<tags>\[[a-z0-9\.\,]+\])",
+    re.IGNORECASE,
+)
+YEAR_HINT_PATTERN = re.compile(r"\(\d{4}\)")
+
 
 # ============================================================================
 # MergerFS Support Functions
@@ -47,38 +58,162 @@ MERGERFS_XATTR_BASEPATH = b"user.mergerfs.basepath"
 MERGERFS_XATTR_RELPATH = b"user.mergerfs.relpath"
 MERGERFS_XATTR_FULLPATH = b"user.mergerfs.fullpath"
 
+MOUNTINFO_PATH = "/proc/self/mountinfo"
+
+# Devices missing from mountinfo that were probed to be (True) or not to be
+# (False) MergerFS mounts. Files on a device that does not expose the MergerFS
+# attributes skip the xattr probe.
+_MOUNT_IS_MERGERFS: dict[int, bool] = {}
+
+
+@functools.cache
+def _scan_mounts() -> dict[int, bool]:
+    """Map device ids to whether they are MergerFS mounts, read from mountinfo.
+
+    The file system type is a property of the mount, so one read of
+    /proc/self/mountinfo classifies every file on it. Returns an empty dict
+    if mountinfo is not available (non-Linux).
+    """
+    mounts: dict[int, bool] = {}
+    try:
+        with open(MOUNTINFO_PATH, encoding="utf-8", errors="replace") as f:
+            for line in f:
+                # id parent major:minor root mountpoint options [optional...] - fstype source superopts
+                fields = line.split()
+                try:
+                    sep = fields.index("-", 6)
+                    major, minor = fields[2].split(":")
+                    fstype, source = fields[sep + 1], fields[sep + 2]
+                    device = os.makedev(int(major), int(minor))
+                except (ValueError, IndexError):
+                    continue
+                is_mergerfs = fstype == "fuse.mergerfs" or (fstype.startswith("fuse") and source == "mergerfs")
+                mounts[device] = mounts.get(device, False) or is_mergerfs
+    except OSError:
+        pass
+    return mounts
+
+
+def _is_mergerfs_device(device: int) -> bool | None:
+    """Returns whether a device is a MergerFS mount, or None if not known yet."""
+    is_mergerfs = _scan_mounts().get(device)
+    if is_mergerfs is None:
+        # Devices missing from mountinfo (e.g. btrfs subvolumes) stay unknown
+        # until probed
+        is_mergerfs = _MOUNT_IS_MERGERFS.get(device)
+    return is_mergerfs
+
 
-def get_mergerfs_info(filepath: pathlib.Path) -> tuple[str, str] | tuple[None, None]:
+# Cached MergerFS attributes, keyed by (path, attribute name). A plain dict in
+# insertion order serves as a bounded FIFO cache that, unlike lru_cache, allows
+# forgetting single paths once the sync changes them.
+_MERGERFS_ATTR_CACHE: dict[tuple[str, bytes], str | None] = {}
+_MERGERFS_ATTR_CACHE_LOCK = threading.Lock()
+MERGERFS_ATTR_CACHE_SIZE = 16384
+
+
+def _fetch_mergerfs_attr(path: str, name: bytes) -> str | None:
+    """Fetch a single MergerFS attribute for a path.
+
+    Returns None if the attribute is unavailable. Raises FileNotFoundError for
+    missing paths, so that they are not cached: they may be created later
+    during the sync.
+    """
+    try:
+        device = os.stat(path).st_dev
+    except FileNotFoundError:
+        raise
+    except OSError:
+        return None
+    if _is_mergerfs_device(device) is False:
+        return None
+
+    try:
+        # Decode and strip null terminators that MergerFS may include
+        value = os.getxattr(path, name).decode("utf-8").rstrip("\x00")
+    except FileNotFoundError:
+        raise
+    except OSError as e:
+        # Attribute doesn't exist or xattrs not supported: not a MergerFS mount,
+        # remember that for the whole device unless mountinfo knows better.
+        # Other errors (e.g. permissions) only affect this path.
+        if e.errno in (errno.ENODATA, errno.ENOTSUP) and device not in _scan_mounts():
+            _MOUNT_IS_MERGERFS.setdefault(device, False)
+        return None
+    except UnicodeDecodeError:
+        # Unexpected encoding in xattr
+        return None
+
+    _MOUNT_IS_MERGERFS[device] = True
+    return value
+
+
+if _XATTR_AVAILABLE:
+    def _get_mergerfs_attr(filepath: pathlib.Path | str, name: bytes) -> str | None:
+        key = (str(filepath), name)
+        try:
+            return _MERGERFS_ATTR_CACHE[key]
+        except KeyError:
+            pass
+        try:
+            value = _fetch_mergerfs_attr(*key)
+        except FileNotFoundError:
+            return None
+        with _MERGERFS_ATTR_CACHE_LOCK:
+            if len(_MERGERFS_ATTR_CACHE) >= MERGERFS_ATTR_CACHE_SIZE:
+                # Evict the oldest entry
+                _MERGERFS_ATTR_CACHE.pop(next(iter(_MERGERFS_ATTR_CACHE)), None)
+            _MERGERFS_ATTR_CACHE[key] = value
+        return value
+else:
+    # No extended attributes on this platform, so never MergerFS. Bound once at
+    # import instead of checking _XATTR_AVAILABLE on every lookup.
+    def _get_mergerfs_attr(filepath: pathlib.Path | str, name: bytes) -> str | None:
+        return None
+
+
+def _forget_mergerfs_path(filepath: pathlib.Path | str) -> None:
+    """Drop cached MergerFS attributes of a path that has just been changed."""
+    path = str(filepath)
+    with _MERGERFS_ATTR_CACHE_LOCK:
+        for name in (MERGERFS_XATTR_BASEPATH, MERGERFS_XATTR_RELPATH, MERGERFS_XATTR_FULLPATH):
+            _MERGERFS_ATTR_CACHE.pop((path, name), None)
+
+
+class MergerFSInfo(NamedTuple):
+    """Location of a path on the underlying MergerFS branch."""
+    branch: str | None
+    relpath: str | None
+
+
+def get_mergerfs_info(filepath: pathlib.Path | str) -> MergerFSInfo:
     """Returns (branch, relpath) from MergerFS xattrs, or (None, None) if not available.
 
     Args:
         filepath: Path to a file or directory in the merged filesystem
 
     Returns:
-        Tuple of (branch_path, relative_path) or (None, None) if xattrs unavailable
-        or not a MergerFS mount
+        MergerFSInfo of (branch_path, relative_path), both None if xattrs
+        unavailable or not a MergerFS mount
     """
-    if not _XATTR_AVAILABLE:
-        return None, None
+    branch = _get_mergerfs_attr(filepath, MERGERFS_XATTR_BASEPATH)
+    if branch is None:
+        return MergerFSInfo(None, None)
+    relpath = _get_mergerfs_attr(filepath, MERGERFS_XATTR_RELPATH)
+    if relpath is None:
+        return MergerFSInfo(None, None)
+    return MergerFSInfo(branch, relpath)
 
-    try:
-        attrs = xattr.xattr(str(filepath))
-        branch = attrs.get(MERGERFS_XATTR_BASEPATH)
-        relpath = attrs.get(MERGERFS_XATTR_RELPATH)
 
-        # Decode and strip null terminators that MergerFS may include
-        branch_str = branch.decode("utf-8").rstrip("\x00")
-        relpath_str = relpath.decode("utf-8").rstrip("\x00")
-
-        return branch_str, relpath_str
-    except (KeyError, OSError, UnicodeDecodeError):
-        # KeyError: attribute doesn't exist (not MergerFS or not configured)
-        # OSError: file doesn't exist or no permissions
-        # UnicodeDecodeError: unexpected encoding in xattr
-        return None, None
+def get_mergerfs_branch(filepath: pathlib.Path | str) -> str | None:
+    """Returns the MergerFS branch of a path, or None if not available.
 
+    Cheaper than get_mergerfs_info() when the relative path is not needed.
+    """
+    return _get_mergerfs_attr(filepath, MERGERFS_XATTR_BASEPATH)
 
-def get_mergerfs_fullpath(filepath: pathlib.Path) -> str | None:
+
+def get_mergerfs_fullpath(filepath: pathlib.Path | str) -> str | None:
     """Returns the full physical path from MergerFS xattrs, or None if not available.
 
     Args:
@@ -87,15 +222,7 @@ def get_mergerfs_fullpath(filepath: pathlib.Path) -> str | None:
     Returns:
         Full physical path on underlying branch, or None if not available
     """
-    if not _XATTR_AVAILABLE:
-        return None
-
-    try:
-        attrs = xattr.xattr(str(filepath))
-        fullpath = attrs.get(MERGERFS_XATTR_FULLPATH)
-        return fullpath.decode("utf-8").rstrip("\x00")
-    except (KeyError, OSError, UnicodeDecodeError):
-        return None
+    return _get_mergerfs_attr(filepath, MERGERFS_XATTR_FULLPATH)
 
 
 def is_colocated(src: pathlib.Path, dst: pathlib.Path) -> tuple[bool, str | None]:
@@ -113,22 +240,36 @@ def is_colocated(src: pathlib.Path, dst: pathlib.Path) -> tuple[bool, str | None
     Returns:
         Tuple of (can_hardlink, reason_if_cannot)
     """
-    src_branch, _ = get_mergerfs_info(src)
+    src_branch = get_mergerfs_branch(src)
 
     # Not a MergerFS mount or xattrs unavailable - assume OK
     if src_branch is None:
         return True, None
 
-    # We have MergerFS - check if destination directory exists and is on same branch
-    dst_dir = dst.parent if dst.is_file() or dst.suffix else dst
+    # We have MergerFS - check if destination directory exists and is on same branch.
+    # A single lstat() of dst answers both "is it a file?" and, for the common
+    # cases, "does the directory exist?".
+    dst_str = os.fspath(dst)
+    try:
+        dst_stat: os.stat_result | None = os.lstat(dst_str)
+    except OSError:
+        dst_stat = None
+    dst_is_file = dst_stat is not None and stat.S_ISREG(dst_stat.st_mode)
+
+    if dst_is_file or os.path.splitext(dst_str)[1]:
+        dst_dir = os.path.dirname(dst_str)
+        dst_dir_exists = dst_is_file or os.path.isdir(dst_dir)
+    else:
+        dst_dir = dst_str
+        dst_dir_exists = dst_stat is not None
 
-    if not dst_dir.exists():
+    if not dst_dir_exists:
         # Destination directory doesn't exist yet - we can't verify colocation
         # This is a case where we need to rely on precreation happening correctly
         # Return True and let the hardlink attempt fail if it would cross branches
         return True, None
 
-    dst_branch, _ = get_mergerfs_info(dst_dir)
+    dst_branch = get_mergerfs_branch(dst_dir)
 
     # If we can't determine dst branch, assume it might be OK
     if dst_branch is None:
@@ -164,11 +305,7 @@ def get_physical_path(filepath: pathlib.Path) -> pathlib.Path:
 
 
 # ============================================================================
-# Minimum number of items expected in source library to proceed with --delete
 # Protects against wiping target when source mount fails
-MIN_SOURCE_ITEMS_FOR_DELETE = 1
-
-
 def is_source_empty_or_unmounted(source_path: pathlib.Path) -> bool:
     """Check if source directory appears empty or unmounted.
 
@@ -180,24 +317,45 @@ def is_source_empty_or_unmounted(source_path: pathlib.Path) -> bool:
     - Is completely empty
     """
     try:
-        # Use os.scandir for efficient directory scanning (avoids stat calls)
+        # Use os.scandir for efficient directory scanning (avoids stat calls),
+        # a single directory (movie folder) is enough
         with os.scandir(source_path) as entries:
-            dir_count = 0
-            for entry in entries:
-                # Only count directories (movie folders)
-                if entry.is_dir(follow_symlinks=False):
-                    dir_count += 1
-                    if dir_count >= MIN_SOURCE_ITEMS_FOR_DELETE:
-                        return False
-            return dir_count == 0
+            return not any(entry.is_dir(follow_symlinks=False) for entry in entries)
     except OSError as e:
         # Permission denied or other access errors suggest mount issues
         log.error("Cannot access source directory '%s': %s", source_path, e)
         return True
 
 
+def _branch_of(path: str, branches: frozenset[str]) -> str | None:
+    """Return the branch containing a normalized absolute path, if any.
+
+    Walks up the parents of the path, so the cost depends on the path depth
+    and not on the number of branches.
+    """
+    while path not in branches:
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
+    return path
+
+
+def _dir_stat(path: pathlib.Path) -> os.stat_result | None:
+    """Stat a directory, returns None if the path is missing or not a directory."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st if stat.S_ISDIR(st.st_mode) else None
+
+
 def are_same_filesystem(
-    path1: pathlib.Path, path2: pathlib.Path, mergerfs_branches: Optional[list[str]] = None
+    path1: pathlib.Path,
+    path2: pathlib.Path,
+    mergerfs_branches: Optional[list[str]] = None,
+    stat1: os.stat_result | None = None,
+    stat2: os.stat_result | None = None,
 ) -> tuple[bool, bool]:
     """Check if two paths are on the same filesystem with MergerFS awareness.
 
@@ -214,6 +372,8 @@ def are_same_filesystem(
         path2: Second path to check
         mergerfs_branches: Optional list of known MergerFS branch paths for
             additional validation (e.g., ["/mnt/disk1", "/mnt/disk2"])
+        stat1: Stat result of path1 if already known, to avoid stat'ing it again
+        stat2: Stat result of path2 if already known, to avoid stat'ing it again
 
     Returns:
         Tuple of (is_same, is_mergerfs):
@@ -221,8 +381,8 @@ def are_same_filesystem(
         - is_mergerfs: True if path1 appears to be on a MergerFS mount
     """
     # First try MergerFS detection
-    branch1, _ = get_mergerfs_info(path1)
-    branch2, _ = get_mergerfs_info(path2)
+    branch1 = get_mergerfs_branch(path1)
+    branch2 = get_mergerfs_branch(path2)
 
     if branch1 is not None or branch2 is not None:
         # We're on MergerFS - skip base directory check entirely
@@ -235,22 +395,27 @@ def are_same_filesystem(
 
     # Neither is MergerFS (or xattrs unavailable) - fall back to st_dev
     try:
-        stat1 = path1.stat()
-        stat2 = path2.stat()
+        if stat1 is None:
+            stat1 = path1.stat()
+        if stat2 is None:
+            stat2 = path2.stat()
 
         # Additional check: if mergerfs_branches provided, verify neither path
         # is directly under one of the branches (would indicate the caller
         # should be using the merged path instead)
         if mergerfs_branches:
-            path1_str = str(path1.resolve())
-            path2_str = str(path2.resolve())
-            for branch in mergerfs_branches:
-                if path1_str.startswith(branch) or path2_str.startswith(branch):
-                    log.warning(
-                        "Direct branch path detected. Using branch paths directly "
-                        "bypasses MergerFS. Consider using the merged path for consistency."
-                    )
-                    break
+            # Compare normalized paths, resolve() costs a lstat per path
+            # component and is only needed when a path is a symlink
+            paths = [
+                str(path.resolve()) if path.is_symlink() else os.path.normpath(os.path.abspath(path))
+                for path in (path1, path2)
+            ]
+            branches = frozenset(os.path.normpath(branch) for branch in mergerfs_branches)
+            if any(_branch_of(path, branches) for path in paths):
+                log.warning(
+                    "Direct branch path detected. Using branch paths directly "
+                    "bypasses MergerFS. Consider using the merged path for consistency."
+                )
 
         return stat1.st_dev == stat2.st_dev, False
     except OSError:
@@ -258,6 +423,10 @@ def are_same_filesystem(
         return False, False
 
 
+# Number of movie folders sampled by the --check-colocation preflight check
+COLOCATION_SAMPLE_SIZE = 10
+
+
 def _check_library_colocation(
     source_lib: MediaLibrary,
     target_lib: MediaLibrary,
@@ -279,25 +448,25 @@ def _check_library_colocation(
     Returns:
         True if all sampled files are properly colocated, False otherwise
     """
-    sample_size = min(10, sum(1 for _ in source_lib.scan()))
-    if sample_size == 0:
-        log.warning("No movies found for colocation check")
-        return True
-
     checked = 0
     failed = 0
 
+    # Single streaming pass over the library, stops after enough samples
     for entry, movie in source_lib.scan():
-        if checked >= sample_size:
+        if checked >= COLOCATION_SAMPLE_SIZE:
             break
 
         target_name = target_lib.movie_name(movie)
         target_path = target_lib.base_dir / target_name
 
-        # Find a sample file in the source entry
+        # Find a sample file in the source entry (file type comes from the
+        # directory listing, no stat per entry)
         try:
-            for f in entry.iterdir():
-                if f.is_file():
+            with os.scandir(entry) as it:
+                for dir_entry in it:
+                    if not dir_entry.is_file(follow_symlinks=False):
+                        continue
+                    f = pathlib.Path(dir_entry.path)
                     can_link, reason = is_colocated(f, target_path / f.name)
                     if not can_link:
                         log.error(
@@ -306,7 +475,7 @@ def _check_library_colocation(
                         )
                         failed += 1
                     elif verbose:
-                        src_branch, _ = get_mergerfs_info(f)
+                        src_branch = get_mergerfs_branch(f)
                         log.debug(
                             "Colocation OK for '%s' (branch: %s)",
                             entry.name, src_branch or "unknown"
@@ -316,6 +485,10 @@ def _check_library_colocation(
         except OSError as e:
             log.warning("Cannot check colocation for '%s': %s", entry.name, e)
 
+    if checked == 0:
+        log.warning("No movie files found for colocation check")
+        return True
+
     if failed > 0:
         log.error(
             "Colocation check: %d/%d samples failed. "
@@ -325,40 +498,75 @@ def _check_library_colocation(
         return False
 
     if verbose:
-        log.info("Colocation check: %d/%d samples OK", checked, sample_size)
+        log.info("Colocation check: %d/%d samples OK", checked, checked)
 
     return True
 
 
-def verify_hardlink(source: pathlib.Path, target: pathlib.Path) -> bool:
+def _ino(st: os.stat_result) -> tuple[int, int]:
+    """Return the (st_dev, st_ino) identity of a stat result."""
+    return st.st_dev, st.st_ino
+
+
+def _suffix_lower(name: str) -> str:
+    """Return the lowercase suffix of a file name, like PurePath.suffix.lower().
+
+    Works on plain names so that directory entries need no Path object.
+    """
+    i = name.rfind(".")
+    return name[i:].lower() if 0 < i < len(name) - 1 else ""
+
+
+def verify_hardlink(
+    source: pathlib.Path,
+    target: pathlib.Path,
+    source_stat: os.stat_result | None = None,
+    target_stat: os.stat_result | None = None,
+) -> bool:
     """Verify that target is a valid hard link to source by comparing physical inodes.
 
     For MergerFS filesystems, resolves physical paths on underlying branches
     before comparing (st_dev, st_ino) tuples. This prevents false negatives
     caused by inode virtualization on the merged mount.
 
+    Stat results the caller already holds for source and target can be passed
+    in, so that the paths are not stat'ed again.
+
     Returns True if both files share the same physical inode (valid hard link),
     False otherwise.
     """
     try:
-        # Resolve physical paths for MergerFS-aware verification
-        source_phys = get_physical_path(source)
-        target_phys = get_physical_path(target)
-
-        # If we are on MergerFS, we MUST resolve to physical paths
-        # If get_physical_path returns the same path, try manual resolution
-        if source_phys == source and _XATTR_AVAILABLE:
-             # Try to force find physical disk if xattr failed (e.g. if file is new)
-             found_src = _find_source_disk(source)
-             if found_src:
-                 source_phys = found_src
-             
-             found_dst = _find_source_disk(target)
-             if found_dst:
-                 target_phys = found_dst
-
-        source_stat = source_phys.stat()
-        target_stat = target_phys.stat()
+        source_phys = source
+        target_phys = target
+        if source_stat is None:
+            source_stat = source.stat()
+
+        # Only MergerFS virtualizes inodes: on mounts known to be something
+        # else the inodes of the given paths are the physical ones
+        if _is_mergerfs_device(source_stat.st_dev) is not False:
+            # Resolve physical paths for MergerFS-aware verification
+            source_phys = get_physical_path(source)
+            target_phys = get_physical_path(target)
+
+            # If we are on MergerFS, we MUST resolve to physical paths
+            # If get_physical_path returns the same path, try manual resolution
+            if source_phys == source and _XATTR_AVAILABLE:
+                 # Try to force find physical disk if xattr failed (e.g. if file is new)
+                 found_src = _find_source_disk(source)
+                 if found_src:
+                     source_phys = found_src
+                 
+                 found_dst = _find_source_disk(target)
+                 if found_dst:
+                     target_phys = found_dst
+
+            if source_phys != source:
+                source_stat = source_phys.stat()
+            if target_phys != target:
+                target_stat = None
+
+        if target_stat is None:
+            target_stat = target_phys.stat()
 
         match = (source_stat.st_dev, source_stat.st_ino) == (target_stat.st_dev, target_stat.st_ino)
         
@@ -401,7 +609,7 @@ def repair_hardlink(
         return True
 
     try:
-        target.unlink()
+        os.unlink(target)
         if safe_hardlink(source, target):
             log.info("Repaired hard link: %s", target)
             return True
@@ -420,43 +628,45 @@ class VerifyStats:
     links_repaired: int = 0
 
 
+# Physical disks of the MergerFS pool that _find_source_disk() searches
+PHYSICAL_DISK_ROOTS = tuple(pathlib.Path(f"/mnt/disk{n}") for n in range(1, 20)) + (pathlib.Path("/mnt/downloads"),)
+
+
+@functools.cache
+def _existing_disk_roots() -> tuple[pathlib.Path, ...]:
+    """Physical disk roots present on this system, probed once per run."""
+    return tuple(root for root in PHYSICAL_DISK_ROOTS if root.exists())
+
+
+# Disk root on which a file was last found, per folder below /Media/. The
+# files of a movie folder almost always share a disk, so it is probed first.
+_SOURCE_DISK_HINTS: dict[str, pathlib.Path] = {}
+
+
 def _find_source_disk(source_merged_path: pathlib.Path) -> pathlib.Path | None:
     """Find which physical disk (/mnt/disk* or /mnt/downloads) contains the source file.
     
     Returns the path to the actual file on the physical disk.
     """
-    # Check each physical disk
-    for disk_num in range(1, 20):  # disk1 through disk19
-        disk_path = pathlib.Path(f"/mnt/disk{disk_num}")
-        if not disk_path.exists():
-            continue
-            
-        # The source merged path is like: /mnt/storage/Media/movies/Movie/file.mkv
-        # Check if this file exists on this disk at: /mnt/disk1/Media/movies/Movie/file.mkv
-        try:
-            # Extract the path after /Media/ from the merged path
-            merged_str = str(source_merged_path)
-            if '/Media/' in merged_str:
-                rel_from_media = merged_str.split('/Media/', 1)[1]
-                test_path = disk_path / 'Media' / rel_from_media
-                if test_path.exists():
-                    return test_path
-        except (ValueError, IndexError):
-            continue
-    
-    # Also check /mnt/downloads
-    downloads_path = pathlib.Path("/mnt/downloads")
-    if downloads_path.exists():
-        try:
-            merged_str = str(source_merged_path)
-            if '/Media/' in merged_str:
-                rel_from_media = merged_str.split('/Media/', 1)[1]
-                test_path = downloads_path / 'Media' / rel_from_media
-                if test_path.exists():
-                    return test_path
-        except (ValueError, IndexError):
-            pass
-    
+    # The source merged path is like: /mnt/storage/Media/movies/Movie/file.mkv
+    # Check if this file exists on a disk at: /mnt/disk1/Media/movies/Movie/file.mkv
+    merged_str = str(source_merged_path)
+    if '/Media/' not in merged_str:
+        return None
+    rel_from_media = merged_str.split('/Media/', 1)[1]
+    rel_folder = os.path.dirname(rel_from_media)
+
+    disk_roots = _existing_disk_roots()
+    hint = _SOURCE_DISK_HINTS.get(rel_folder)
+    if hint is not None:
+        disk_roots = (hint,) + tuple(root for root in disk_roots if root != hint)
+
+    for disk_path in disk_roots:
+        test_path = disk_path / 'Media' / rel_from_media
+        if test_path.exists():
+            _SOURCE_DISK_HINTS[rel_folder] = disk_path
+            return test_path
+
     return None
 
 
@@ -499,10 +709,6 @@ def _compute_target_on_same_disk(source_phys: pathlib.Path, target_merged: pathl
     source_suffix = list(source_parts[common_len:])  # ['movies', 'Movie', 'file.mkv']
     target_suffix = list(target_parts[common_len:])  # ['jellyfin', 'movies', 'Movie', 'file.mkv']
     
-    # The source physical path on disk includes the full path from Media/
-    # We need to replace the source-specific part with target-specific part
-    source_phys_str = str(source_phys)
-    
     # Build target by replacing the diverging parts
     # Remove source suffix from physical path and add target suffix
     result_parts = list(source_phys.parts)
@@ -542,6 +748,16 @@ def _resolve_physical_target(source: pathlib.Path, target: pathlib.Path) -> tupl
         return None, None
 
 
+def _forget_mergerfs_link_target(target: pathlib.Path) -> None:
+    """Invalidate cached MergerFS attributes after a hard link was created.
+
+    Linking may replace an existing target and may clone the target's parent
+    directory onto another branch, so both cached entries can be stale.
+    """
+    _forget_mergerfs_path(target)
+    _forget_mergerfs_path(target.parent)
+
+
 def safe_hardlink(source: pathlib.Path, target: pathlib.Path) -> bool:
     """Create a hardlink with proper error handling and MergerFS awareness.
 
@@ -553,7 +769,10 @@ def safe_hardlink(source: pathlib.Path, target: pathlib.Path) -> bool:
     Handles cross-device links (EXDEV) and permission errors (EACCES) gracefully.
     """
     try:
-        target.hardlink_to(source)
+        # os.link() directly: sources are regular files, so there is no need
+        # for the symlink-following linkat() that Path.hardlink_to() requests
+        os.link(source, target, follow_symlinks=False)
+        _forget_mergerfs_link_target(target)
         return True
     except OSError as e:
         if e.errno == errno.EXDEV:
@@ -572,17 +791,21 @@ def safe_hardlink(source: pathlib.Path, target: pathlib.Path) -> bool:
                 return False
 
             try:
-                # Create directory structure on physical branch
+                # Create hardlink using physical paths. The directory structure
+                # on the physical branch usually exists already, so it is only
+                # created when the link fails for a missing parent.
                 phys_target_parent = phys_target.parent
-                phys_target_parent.mkdir(parents=True, exist_ok=True)
-
-                # Create hardlink using physical paths
-                phys_target.hardlink_to(phys_source)
+                try:
+                    os.link(phys_source, phys_target, follow_symlinks=False)
+                except FileNotFoundError:
+                    phys_target_parent.mkdir(parents=True, exist_ok=True)
+                    os.link(phys_source, phys_target, follow_symlinks=False)
 
                 log.info(
                     "Created physical hardlink: %s -> %s (branch: %s)",
                     phys_source, phys_target, phys_target_parent.parts[2] if len(phys_target_parent.parts) > 2 else "unknown"
                 )
+                _forget_mergerfs_link_target(target)
                 return True
 
             except Exception as phys_err:
@@ -623,22 +846,21 @@ def resolve_movie_folder(source_lib: MediaLibrary, partial_path: str) -> pathlib
         return None
     path = pathlib.Path(partial_path)
 
-    # If path exists and is absolute or relative to cwd
-    if path.exists() and path.is_dir():
-        # Check if it is inside source_lib
-        try:
-            # This checks if path is subpath of source_lib.base_dir
-            # We resolve to handle symlinks or relative paths
-            if source_lib.base_dir.resolve() in path.resolve().parents or source_lib.base_dir.resolve() == path.resolve():
-                return path
-        except Exception:
-            pass
+    # If path exists and is absolute or relative to cwd (is_dir() is False for
+    # missing paths, so one stat covers both checks)
+    if path.is_dir():
+        # Check if it is inside source_lib. base_dir is already resolved by
+        # MediaLibrary, a plain absolute path is enough for the movie folder.
+        source_abs = str(source_lib.base_dir)
+        movie_abs = os.path.abspath(partial_path)
+        if movie_abs == source_abs or movie_abs.startswith(source_abs + os.sep):
+            return path
 
     # Try matching by folder name
     # This handles Docker path remapping
     folder_name = path.name
     candidate = source_lib.base_dir / folder_name
-    if candidate.exists() and candidate.is_dir():
+    if candidate.is_dir():
         return candidate
 
     return None
@@ -660,22 +882,19 @@ def scan_media_library(
         raise ValueError("Can not transfer library into itself")
 
     stats = stats or LibraryStats()
-    movies_to_sync: dict[str, tuple[pathlib.Path, MovieInfo] | None] = {}
-    conflicting_source_dirs: dict[str, list[str]] = {}
+    movies_to_sync: defaultdict[str, list[tuple[pathlib.Path, MovieInfo]]] = defaultdict(list)
 
     # Inspect source libary for movie folders to sync
     for entry, movie in source.scan():
-        target_name = target.movie_name(movie)
-        if target_name in movies_to_sync:
-            if target_name not in conflicting_source_dirs:
-                item = movies_to_sync[target_name]
-                conflicting_source_dirs[target_name] = [item[0].name] if item else []
-            conflicting_source_dirs[target_name].append(entry.name)
-            movies_to_sync[target_name] = None
-        else:
-            movies_to_sync[target_name] = (entry, movie)
+        movies_to_sync[target.movie_name(movie)].append((entry, movie))
         stats.movies_total += 1
 
+    conflicting_source_dirs = {
+        target_name: [entry.name for entry, _ in items]
+        for target_name, items in movies_to_sync.items()
+        if len(items) > 1
+    }
+
     # If there are any conflicts we bail out now
     if conflicting_source_dirs:
         for dst, src in conflicting_source_dirs.items():
@@ -685,11 +904,10 @@ def scan_media_library(
         return
 
     # Yield items for sync
-    for target_name, item in movies_to_sync.items():
-        if not item:
-            continue
+    for target_name, items in movies_to_sync.items():
+        entry, movie = items[0]
         stats.movies_processed += 1
-        yield item[0], target.base_dir / target_name, item[1]
+        yield entry, target.base_dir / target_name, movie
 
     # Remove stray items in target library
     for entry in target.base_dir.iterdir():
@@ -714,6 +932,8 @@ class AssetStats:
     links_verified: int = 0
     links_broken: int = 0
     links_repaired: int = 0
+    # Items that could not be linked, renamed or checked
+    errors: int = 0
 
 
 def process_assets_folder(
@@ -730,28 +950,44 @@ def process_assets_folder(
     if not source_path.is_dir():
         raise ValueError(f"{source_path!s} is not a folder")
 
-    # In verify_only mode, skip creating directories
-    if not target_path.exists():
+    stats = stats if stats else AssetStats()
+
+    # List the target folder once: existence of target files and their
+    # inodes are taken from this listing, and whatever is left in it after
+    # the source loop is stray
+    dst_entries: dict[str, os.DirEntry[str]] = {}
+    try:
+        with os.scandir(target_path) as it:
+            dst_entries = {dst_entry.name: dst_entry for dst_entry in it}
+    except FileNotFoundError:
+        # In verify_only mode, skip creating directories
         if verify_only:
             # Nothing to verify if target doesn't exist
-            return stats if stats else AssetStats()
+            return stats
         if dry_run:
             log.info("MKDIR  %s", target_path)
         else:
             target_path.mkdir(parents=True, exist_ok=True)
-
-    stats = stats if stats else AssetStats()
-    synced_items = {}
-
-    # Hardlink missing files and dive into subfolders
-    for entry in source_path.iterdir():
+    except OSError as e:
+        log.warning("Cannot list target folder '%s': %s", target_path, e)
+        stats.errors += 1
+    # Checked once per folder, the per-file debug messages are skipped early
+    debug = log.isEnabledFor(logging.DEBUG)
+
+    # Hardlink missing files and dive into subfolders. Entry types come
+    # from the directory listing and one stat serves all checks of a file.
+    with os.scandir(source_path) as it:
+        src_entries = list(it)
+    for src_entry in src_entries:
         # Skip symlinks to avoid unexpected behavior
-        if entry.is_symlink():
-            log.debug("Skipping symlink '%s'", entry.name)
+        if src_entry.is_symlink():
+            if debug:
+                log.debug("Skipping symlink '%s'", src_entry.name)
             continue
 
+        entry = pathlib.Path(src_entry.path)
         dest = target_path / entry.name
-        if entry.is_dir():
+        if src_entry.is_dir(follow_symlinks=False):
             process_assets_folder(
                 entry, dest,
                 verbose=verbose,
@@ -761,22 +997,31 @@ def process_assets_folder(
                 verify_only=verify_only,
                 skip_verify=skip_verify,
             )
-        elif entry.is_file():
+        elif src_entry.is_file(follow_symlinks=False):
             # Skip zero-byte files (likely placeholders or corrupt)
             try:
-                if entry.stat().st_size == 0:
-                    log.debug("Skipping zero-byte file '%s'", entry.name)
+                src_stat = src_entry.stat(follow_symlinks=False)
+                if src_stat.st_size == 0:
+                    if debug:
+                        log.debug("Skipping zero-byte file '%s'", entry.name)
                     continue
             except OSError:
                 continue
 
-            if dest.exists():
+            dst_entry = dst_entries.pop(entry.name, None)
+            if dst_entry is not None:
                 try:
-                    if dest.samefile(entry):
-                        # Files match by samefile(), now verify inode if not skipping
+                    # A source without other links cannot be linked to the
+                    # target, which then needs no stat
+                    dst_stat = dst_entry.stat() if src_stat.st_nlink > 1 else None
+                    if dst_stat is not None and _ino(dst_stat) == _ino(src_stat):
+                        # Same file as the source, now verify inode if not skipping
                         if not skip_verify:
                             stats.links_verified += 1
-                            if not verify_hardlink(entry, dest):
+                            # Off MergerFS the inode compare above already verified the link
+                            if _is_mergerfs_device(src_stat.st_dev) is not False and not verify_hardlink(
+                                entry, dest, src_stat, dst_stat
+                            ):
                                 stats.links_broken += 1
                                 if verify_only:
                                     log.warning(
@@ -785,7 +1030,9 @@ def process_assets_folder(
                                     )
                                 elif repair_hardlink(entry, dest, dry_run=dry_run):
                                     stats.links_repaired += 1
-                        if verbose:
+                                else:
+                                    stats.errors += 1
+                        if verbose and debug:
                             log.debug("Target file '%s' already exists, skipping", entry.name)
                     else:
                         # Target exists but is not a hardlink to source - relink
@@ -798,8 +1045,11 @@ def process_assets_folder(
                             dest.unlink()
                             if safe_hardlink(entry, dest):
                                 stats.files_linked += 1
+                            else:
+                                stats.errors += 1
                 except OSError as e:
                     log.warning("Cannot check file '%s': %s", dest, e)
+                    stats.errors += 1
                     continue
             else:
                 # Target doesn't exist - create link (unless verify_only)
@@ -811,19 +1061,19 @@ def process_assets_folder(
                     # Do not increment stats.files_linked in dry-run mode
                 elif safe_hardlink(entry, dest):
                     stats.files_linked += 1
+                else:
+                    stats.errors += 1
             stats.files_total += 1
-        synced_items[entry.name] = dest
+        dst_entries.pop(entry.name, None)
 
-    if delete and not verify_only and target_path.is_dir():
+    if delete and not verify_only:
         # Remove stray items
-        for entry in target_path.iterdir():
-            if entry.name in synced_items:
-                continue
-            log.info("Removing stray item '%s' in target folder", entry.name)
+        for dst_entry in dst_entries.values():
+            log.info("Removing stray item '%s' in target folder", dst_entry.name)
             if dry_run:
-                log.info("DELETE %s", entry.name)
+                log.info("DELETE %s", dst_entry.name)
             else:
-                utils.remove(entry)
+                utils.remove(pathlib.Path(dst_entry.path))
             stats.items_removed += 1
 
     return stats
@@ -840,6 +1090,29 @@ class MovieStats:
     links_verified: int = 0
     links_broken: int = 0
     links_repaired: int = 0
+    # Items that could not be linked, renamed or checked
+    errors: int = 0
+
+    def merge(self, other: "MovieStats") -> None:
+        self.videos_total += other.videos_total
+        self.videos_linked += other.videos_linked
+        self.items_removed += other.items_removed
+        self.asset_items_total += other.asset_items_total
+        self.asset_items_linked += other.asset_items_linked
+        self.asset_items_removed += other.asset_items_removed
+        self.links_verified += other.links_verified
+        self.links_broken += other.links_broken
+        self.links_repaired += other.links_repaired
+        self.errors += other.errors
+
+    def merge_from_asset(self, other: AssetStats) -> None:
+        self.asset_items_total += other.files_total
+        self.asset_items_linked += other.files_linked
+        self.asset_items_removed += other.items_removed
+        self.links_verified += other.links_verified
+        self.links_broken += other.links_broken
+        self.links_repaired += other.links_repaired
+        self.errors += other.errors
 
 
 def process_movie(
@@ -854,76 +1127,113 @@ def process_movie(
     update_filenames: bool = False,
     verify_only: bool = False,
     skip_verify: bool = False,
+    skip_unchanged: bool = False,
+    executor: Executor | None = None,
 ) -> MovieStats:
     target_path = target.movie_path(movie)
 
+    # Adding, removing or renaming files in the source folder updates its
+    # mtime, and linking them updates the target folder's. A movie synced
+    # without errors gets the mtime of its source folder stamped on the target
+    # folder below, so equal mtimes mean there is nothing new to link.
+    source_mtime_ns: int | None = None
+    if skip_unchanged and not (delete or verify_only or update_filenames):
+        try:
+            source_mtime_ns = source_path.stat().st_mtime_ns
+            if target_path.stat().st_mtime_ns == source_mtime_ns:
+                if verbose:
+                    log.info(f"Skipping unchanged '{source_path.name}'")
+                return MovieStats()
+        except OSError:
+            pass
+
     if verbose:
         log.info(f"Processing '{source_path.name}' → '{target_path.name}'")
 
     stats = MovieStats()
+    # Checked once per movie, the per-file debug messages are skipped early
+    debug = log.isEnabledFor(logging.DEBUG)
 
     videos_to_sync: dict[str, tuple[pathlib.Path, pathlib.Path]] = {}
-    assets_to_sync: dict[str, tuple[pathlib.Path, pathlib.Path]] = {}
-
-    # Scan for video files and assets using os.scandir for efficiency
+    # Asset folders and associated files, with the lstat result of associated
+    # files taken when they are matched (None for folders)
+    assets_to_sync: dict[str, tuple[pathlib.Path, pathlib.Path, os.stat_result | None]] = {}
+
+    # Scan for video files and assets using os.scandir for efficiency. A
+    # single pass sorts the entries, keeping only the paths that are needed.
+    video_entries: list[tuple[pathlib.Path, str]] = []
+    # Associated files are matched against the video stems afterwards
+    # instead of globbing the folder again for every video
+    associated_entries: list[pathlib.Path] = []
+    video_suffixes = ACCEPTED_VIDEO_SUFFIXES
+    associated_suffixes = ACCEPTED_ASSOCIATED_SUFFIXES
     try:
-        entries_list = list(os.scandir(source_path))
+        with os.scandir(source_path) as it:
+            for dir_entry in it:
+                try:
+                    is_file = dir_entry.is_file(follow_symlinks=False)
+                    is_dir = dir_entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+
+                name = dir_entry.name
+                suffix = _suffix_lower(name)
+                if suffix in associated_suffixes:
+                    associated_entries.append(pathlib.Path(dir_entry.path))
+                if is_file and suffix in video_suffixes:
+                    video_entries.append((pathlib.Path(dir_entry.path), suffix))
+                elif is_dir:
+                    # Skip hidden directories and symlinks
+                    if name.startswith("."):
+                        if debug:
+                            log.debug("Ignoring hidden folder '%s'", name)
+                        continue
+                    assets_to_sync[name] = (pathlib.Path(dir_entry.path), target_path / name, None)
     except OSError as e:
         log.error("Failed to scan movie folder '%s': %s", source_path, e)
         return MovieStats()
 
-    for dir_entry in entries_list:
-        try:
-            entry = pathlib.Path(dir_entry.path)
-            is_file = dir_entry.is_file(follow_symlinks=False)
-            is_dir = dir_entry.is_dir(follow_symlinks=False)
-        except OSError:
-            continue
-
-        if is_file and entry.suffix.lower() in ACCEPTED_VIDEO_SUFFIXES:
-            video = source.parse_video_path(entry)
-            video_path = target.video_path(movie, video or VideoInfo(extension=entry.suffix.lower()))
-            video_name = video_path.name
-            if video_name in videos_to_sync:
-                log.error("Conflicting video file '%s'. Aborting.", entry.name)
-                return MovieStats()
-            videos_to_sync[video_name] = (entry, video_path)
-            stats.videos_total += 1
-
-            # Find associated files
-            base_stem = entry.stem
-            target_stem = video_path.stem
-            # Use glob.escape because filename may contain brackets which are special chars in glob
-            for associated_entry in source_path.glob(f"{pyglob.escape(base_stem)}.*"):
-                if associated_entry == entry:
-                    continue
-                # Associated extensions we want to sync
-                if associated_entry.suffix.lower() not in ACCEPTED_ASSOCIATED_SUFFIXES:
-                    continue
-
-                # Construct target name: replace base_stem with target_stem
-                # Example: Movie.mkv -> Movie.en.srt
-                # Target:  Movie-Edition.mkv -> Movie-Edition.en.srt
-                suffix_part = associated_entry.name[len(base_stem):]
-                target_associated_name = f"{target_stem}{suffix_part}"
-                target_associated_path = target_path / target_associated_name
+    for entry, suffix in video_entries:
+        video = source.parse_video_path(entry)
+        video_path = target.video_path(movie, video or VideoInfo(extension=suffix))
+        video_name = video_path.name
+        if video_name in videos_to_sync:
+            log.error("Conflicting video file '%s'. Aborting.", entry.name)
+            return MovieStats()
+        videos_to_sync[video_name] = (entry, video_path)
+        stats.videos_total += 1
+
+        # Find associated files
+        base_stem = entry.stem
+        target_stem = video_path.stem
+        associated_prefix = base_stem + "."
+        for associated_entry in associated_entries:
+            if not associated_entry.name.startswith(associated_prefix):
+                continue
 
-                if target_associated_name in assets_to_sync:
-                    # Should not happen usually given unique mapping
-                    continue
+            # Construct target name: replace base_stem with target_stem
+            # Example: Movie.mkv -> Movie.en.srt
+            # Target:  Movie-Edition.mkv -> Movie-Edition.en.srt
+            suffix_part = associated_entry.name[len(base_stem):]
+            target_associated_name = f"{target_stem}{suffix_part}"
+            target_associated_path = target_path / target_associated_name
 
-                assets_to_sync[target_associated_name] = (associated_entry, target_associated_path)
+            if target_associated_name in assets_to_sync:
+                # Should not happen usually given unique mapping
+                continue
 
-        elif is_dir:
-            dir_name = entry.name
-            # Skip hidden directories and symlinks
-            if dir_name.startswith("."):
-                log.debug("Ignoring hidden folder '%s'", dir_name)
+            try:
+                associated_stat = os.lstat(associated_entry)
+            except OSError:
                 continue
-            assets_to_sync[dir_name] = (entry, target_path / dir_name)
+            assets_to_sync[target_associated_name] = (associated_entry, target_associated_path, associated_stat)
+
+    # A target folder that does not exist yet holds no files, so the probes
+    # for existing target files below can all be skipped
+    target_missing = not target_path.exists()
 
     # In verify_only mode, skip creating directories
-    if not target_path.exists():
+    if target_missing:
         if verify_only:
             # Nothing to verify if target doesn't exist
             return stats
@@ -935,57 +1245,81 @@ def process_movie(
     # Pre-scan target directory to build a map of existing inodes
     # This optimizes stale candidate detection by avoiding repeated directory scans
     existing_inodes: dict[int, pathlib.Path] = {}
+    target_entries: dict[str, os.DirEntry[str]] = {}
     # Track stale files that should be preserved (not renamed but still valid hardlinks)
     preserved_stale_files: set[str] = set()
 
-    if target_path.exists():
-        for candidate in target_path.iterdir():
-            if not candidate.is_file():
-                continue
-            if candidate.suffix.lower() not in ACCEPTED_VIDEO_SUFFIXES:
-                continue
+    if not target_missing:
+        # File type and name come from the directory listing, only video
+        # files need a stat for their inode
+        with os.scandir(target_path) as it:
+            for candidate in it:
+                target_entries[candidate.name] = candidate
+                if _suffix_lower(candidate.name) not in ACCEPTED_VIDEO_SUFFIXES:
+                    continue
+                try:
+                    if not candidate.is_file(follow_symlinks=False):
+                        continue
+                    existing_inodes[candidate.stat(follow_symlinks=False).st_ino] = pathlib.Path(candidate.path)
+                except OSError:
+                    # File might have been deleted or permission denied
+                    pass
+
+    # Hardlink missing video files
+    for src_item, dst_item in videos_to_sync.values():
+        dest_entry = target_entries.get(dst_item.name)
+        dst_stat = None
+        if dest_entry is not None:
             try:
-                existing_inodes[candidate.stat().st_ino] = candidate
+                dst_stat = dest_entry.stat()
             except OSError:
-                # File might have been deleted or permission denied
+                # Dangling symlink or removed since listing: treat as missing
                 pass
-
-    # Hardlink missing video files
-    for _video_name, item in videos_to_sync.items():
-        if item[1].exists():
-            if item[1].samefile(item[0]):
-                # Files match by samefile(), now verify inode if not skipping
+        if dst_stat is not None:
+            try:
+                src_stat = src_item.stat()
+            except OSError as e:
+                log.warning("Cannot check video file '%s': %s", src_item, e)
+                stats.errors += 1
+                continue
+            if _ino(dst_stat) == _ino(src_stat):
+                # Files share the same inode, now verify physical inode if not skipping
                 if not skip_verify:
                     stats.links_verified += 1
-                    if not verify_hardlink(item[0], item[1]):
+                    # Off MergerFS the inode compare above already verified the link
+                    if _is_mergerfs_device(src_stat.st_dev) is not False and not verify_hardlink(
+                        src_item, dst_item, src_stat, dst_stat
+                    ):
                         stats.links_broken += 1
                         if verify_only:
                             log.warning(
                                 "Broken hard link: %s -> %s (would repair)",
-                                item[1], item[0]
+                                dst_item, src_item
                             )
-                        elif repair_hardlink(item[0], item[1], dry_run=dry_run):
+                        elif repair_hardlink(src_item, dst_item, dry_run=dry_run):
                             stats.links_repaired += 1
+                        else:
+                            stats.errors += 1
                 if verbose:
-                    log.info("Target video file '%s' already exists", item[1].name)
+                    log.info("Target video file '%s' already exists", dst_item.name)
                 continue
             else:
                 # Target exists but is not a hardlink to source - relink
                 if verify_only:
-                    log.warning("Target '%s' exists but is not linked to source", item[1])
+                    log.warning("Target '%s' exists but is not linked to source", dst_item)
                     stats.links_broken += 1
                     continue
-                log.info("Replacing video file '%s' → '%s'", item[0].name, item[1].name)
+                log.info("Replacing video file '%s' → '%s'", src_item.name, dst_item.name)
                 if dry_run:
-                    log.info("DELETE %s", item[1])
+                    log.info("DELETE %s", dst_item)
                 else:
-                    item[1].unlink()
+                    dst_item.unlink()
         else:
             # Check if any existing file in the target folder is a hardlink to the source file
             # This happens if the filename has changed (e.g. edition added)
             stale_candidate: pathlib.Path | None = None
             try:
-                source_inode = item[0].stat().st_ino
+                source_inode = src_item.stat().st_ino
                 if source_inode in existing_inodes:
                     stale_candidate = existing_inodes[source_inode]
             except OSError:
@@ -994,69 +1328,77 @@ def process_movie(
 
             if stale_candidate:
                 # We found a file that is hardlinked to source but has wrong name
-                # Verify if editions match
-                intended_video = target.parse_video_path(item[1])
-                candidate_video = target.parse_video_path(stale_candidate)
-
                 # Relaxed check: trust the inode (it's the same physical file) if update_filenames is requested.
                 # When update_filenames is True, we trust the inode match and rename regardless of edition compatibility,
                 # which may change edition tags or rename files even if editions don't match or can't be parsed.
-                # Otherwise, only rename if the editions match exactly.
-                editions_match = intended_video and candidate_video and intended_video.edition == candidate_video.edition
+                # Otherwise, only rename if the editions match exactly, the names are only parsed for that check.
+                rename_candidate = update_filenames
+                if not rename_candidate:
+                    intended_video = target.parse_video_path(dst_item)
+                    candidate_video = target.parse_video_path(stale_candidate)
+                    rename_candidate = bool(
+                        intended_video and candidate_video and intended_video.edition == candidate_video.edition
+                    )
+
+                if rename_candidate:
+                    # Associated files with the stale name are either renamed or
+                    # preserved below. Cheap name checks first, the file type comes
+                    # from the directory listing. The folder is listed before
+                    # renaming anything in it.
+                    stale_prefix = stale_candidate.stem + "."
+                    with os.scandir(target_path) as it:
+                        sibling_matches = [
+                            (assoc_entry.name, assoc_entry.path) for assoc_entry in it
+                            # Match by stem prefix
+                            if assoc_entry.name.startswith(stale_prefix)
+                            and _suffix_lower(assoc_entry.name) in ACCEPTED_ASSOCIATED_SUFFIXES
+                            and assoc_entry.is_file(follow_symlinks=False)
+                        ]
 
-                if update_filenames or editions_match:
                     if update_filenames:
                         if dry_run:
-                            log.info("RENAME %s -> %s", stale_candidate.name, item[1].name)
+                            log.info("RENAME %s -> %s", stale_candidate.name, dst_item.name)
                         else:
-                            log.info("Renamed '%s' -> '%s'", stale_candidate.name, item[1].name)
+                            log.info("Renamed '%s' -> '%s'", stale_candidate.name, dst_item.name)
                             try:
-                                stale_candidate.rename(item[1])
+                                os.rename(stale_candidate, dst_item)
                             except OSError as e:
                                 log.error("Failed to rename video file '%s': %s", stale_candidate, e)
+                                stats.errors += 1
                                 continue
+                            target_entries.pop(stale_candidate.name, None)
 
                         # Rename associated files
-                        stale_stem = stale_candidate.stem
-                        target_stem = item[1].stem
-                        for assoc_file in item[1].parent.iterdir():
-                            if assoc_file == stale_candidate or assoc_file == item[1]:
-                                continue
-                            if not assoc_file.is_file():
-                                continue
-                            if assoc_file.suffix.lower() not in ACCEPTED_ASSOCIATED_SUFFIXES:
-                                continue
-
-                            # Match by stem prefix
-                            if assoc_file.name.startswith(stale_stem + "."):
-                                suffix_part = assoc_file.name[len(stale_stem):]
-                                new_assoc_name = f"{target_stem}{suffix_part}"
-                                new_assoc_path = item[1].parent / new_assoc_name
-
-                                if dry_run:
-                                    log.info("RENAME %s -> %s", assoc_file.name, new_assoc_name)
-                                else:
-                                    log.info("Renamed '%s' -> '%s'", assoc_file.name, new_assoc_name)
-                                    try:
-                                        assoc_file.rename(new_assoc_path)
-                                    except OSError as e:
-                                        log.warning("Failed to rename associated file '%s': %s", assoc_file.name, e)
+                        # The suffix part of associated names keeps its leading dot
+                        suffix_start = len(stale_prefix) - 1
+                        target_stem = dst_item.stem
+                        target_dir = os.fspath(target_path)
+                        for assoc_name, assoc_path in sibling_matches:
+                            suffix_part = assoc_name[suffix_start:]
+                            new_assoc_name = f"{target_stem}{suffix_part}"
+                            new_assoc_path = os.path.join(target_dir, new_assoc_name)
+
+                            if dry_run:
+                                log.info("RENAME %s -> %s", assoc_name, new_assoc_name)
+                            else:
+                                log.info("Renamed '%s' -> '%s'", assoc_name, new_assoc_name)
+                                try:
+                                    os.rename(assoc_path, new_assoc_path)
+                                except OSError as e:
+                                    log.warning("Failed to rename associated file '%s': %s", assoc_name, e)
+                                    stats.errors += 1
 
                         # Remove from inode map to avoid processing again
                         if source_inode in existing_inodes:
                             del existing_inodes[source_inode]
                         continue
                     else:
-                        log.warning("Stale hardlink '%s' should be '%s'. Use --update-filenames to fix.", stale_candidate.name, item[1].name)
+                        log.warning("Stale hardlink '%s' should be '%s'. Use --update-filenames to fix.", stale_candidate.name, dst_item.name)
                         # Preserve the stale file so it isn't deleted during cleanup
                         # (it's still a valid hardlink to the source, just with wrong name)
                         preserved_stale_files.add(stale_candidate.name)
                         # Also preserve any associated files with the stale name
-                        stale_stem = stale_candidate.stem
-                        for assoc in target_path.iterdir():
-                            if assoc.is_file() and assoc.name.startswith(stale_stem + "."):
-                                if assoc.suffix.lower() in ACCEPTED_ASSOCIATED_SUFFIXES:
-                                    preserved_stale_files.add(assoc.name)
+                        preserved_stale_files.update(assoc_name for assoc_name, _ in sibling_matches)
                         continue
 
         # Create new link (unless verify_only)
@@ -1064,21 +1406,23 @@ def process_movie(
             # Nothing to verify if target doesn't exist
             pass
         elif dry_run:
-            log.info("LINK   %s", item[1])
+            log.info("LINK   %s", dst_item)
             stats.videos_linked += 1
         else:
-            log.info("Linking video file '%s' → '%s'", item[0].name, item[1].name)
-            if safe_hardlink(item[0], item[1]):
+            log.info("Linking video file '%s' → '%s'", src_item.name, dst_item.name)
+            if safe_hardlink(src_item, dst_item):
                 stats.videos_linked += 1
-
-    if delete and not verify_only and target_path.is_dir():
-        # Remove stray items (but preserve stale files that are still valid hardlinks)
-        for entry in target_path.iterdir():
-            if entry.name in videos_to_sync or entry.name in assets_to_sync:
-                continue
-            # Don't delete preserved stale files (valid hardlinks with outdated names)
-            if entry.name in preserved_stale_files:
-                continue
+            else:
+                stats.errors += 1
+
+    # A target folder created by this run holds nothing but synced items
+    if delete and not verify_only and not target_missing and target_path.is_dir():
+        # Remove stray items (but preserve stale files that are still valid
+        # hardlinks with outdated names)
+        keep = frozenset(videos_to_sync.keys() | assets_to_sync.keys() | preserved_stale_files)
+        with os.scandir(target_path) as it:
+            strays = [pathlib.Path(entry.path) for entry in it if entry.name not in keep]
+        for entry in strays:
             if dry_run:
                 log.info("DELETE %s", entry)
             else:
@@ -1090,69 +1434,88 @@ def process_movie(
                 utils.remove(entry)
             stats.items_removed += 1
 
-    # Sync assets folders and associated files
-    for _, item in assets_to_sync.items():
+    # Sync assets folders and associated files. With a pool the asset folders
+    # are processed by the workers, each of them handling its own subfolders
+    # serially, and their stats are merged below.
+    asset_folders: list[Future[AssetStats]] = []
+    for src_item, dst_item, src_stat in assets_to_sync.values():
         # Skip symlinks
-        if item[0].is_symlink():
-            log.debug("Skipping symlink '%s'", item[0].name)
+        if src_stat is not None and stat.S_ISLNK(src_stat.st_mode):
+            if debug:
+                log.debug("Skipping symlink '%s'", src_item.name)
             continue
 
-        if item[0].is_dir():
-            s = process_assets_folder(
-                item[0], item[1],
+        if src_stat is None or stat.S_ISDIR(src_stat.st_mode):
+            process_folder = functools.partial(
+                process_assets_folder,
+                src_item, dst_item,
                 delete=delete,
                 verbose=verbose,
                 dry_run=dry_run,
                 verify_only=verify_only,
                 skip_verify=skip_verify,
             )
-            stats.asset_items_total += s.files_total
-            stats.asset_items_linked += s.files_linked
-            stats.asset_items_removed += s.items_removed
-            stats.links_verified += s.links_verified
-            stats.links_broken += s.links_broken
-            stats.links_repaired += s.links_repaired
-        elif item[0].is_file():
+            if executor:
+                asset_folders.append(executor.submit(process_folder))
+            else:
+                stats.merge_from_asset(process_folder())
+        elif stat.S_ISREG(src_stat.st_mode):
             # Skip zero-byte files
-            try:
-                if item[0].stat().st_size == 0:
-                    log.debug("Skipping zero-byte associated file '%s'", item[0].name)
-                    continue
-            except OSError:
+            if src_stat.st_size == 0:
+                if debug:
+                    log.debug("Skipping zero-byte associated file '%s'", src_item.name)
                 continue
 
-            # Handle associated files
-            if item[1].exists():
+            # Handle associated files. The target folder may have changed
+            # through renames above, so the target is stat'ed directly.
+            dst_stat = None
+            if not target_missing:
                 try:
-                    if item[1].samefile(item[0]):
-                        # Files match by samefile(), now verify inode if not skipping
+                    dst_stat = dst_item.stat()
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    log.warning("Cannot check associated file '%s': %s", dst_item, e)
+                    stats.errors += 1
+                    continue
+            if dst_stat is not None:
+                try:
+                    if _ino(dst_stat) == _ino(src_stat):
+                        # Files share the same inode, now verify physical inode if not skipping
                         if not skip_verify:
                             stats.links_verified += 1
-                            if not verify_hardlink(item[0], item[1]):
+                            if _is_mergerfs_device(src_stat.st_dev) is not False and not verify_hardlink(
+                                src_item, dst_item, src_stat, dst_stat
+                            ):
                                 stats.links_broken += 1
                                 if verify_only:
                                     log.warning(
                                         "Broken hard link: %s -> %s (would repair)",
-                                        item[1], item[0]
+                                        dst_item, src_item
                                     )
-                                elif repair_hardlink(item[0], item[1], dry_run=dry_run):
+                                elif repair_hardlink(src_item, dst_item, dry_run=dry_run):
                                     stats.links_repaired += 1
-                        if verbose:
-                            log.debug("Target asset file '%s' already exists, skipping", item[1].name)
+                                else:
+                                    stats.errors += 1
+                        if verbose and debug:
+                            log.debug("Target asset file '%s' already exists, skipping", dst_item.name)
                     else:
                         # Target exists but is not a hardlink to source - relink
                         if verify_only:
-                            log.warning("Target '%s' exists but is not linked to source", item[1])
+                            log.warning("Target '%s' exists but is not linked to source", dst_item)
                             stats.links_broken += 1
                         elif dry_run:
-                            log.info("RELINK %s", item[0])
+                            log.info("RELINK %s", src_item)
                             stats.asset_items_linked += 1
                         else:
-                            item[1].unlink()
-                            if safe_hardlink(item[0], item[1]):
+                            dst_item.unlink()
+                            if safe_hardlink(src_item, dst_item):
                                 stats.asset_items_linked += 1
+                            else:
+                                stats.errors += 1
                 except OSError as e:
-                    log.warning("Cannot check associated file '%s': %s", item[1], e)
+                    log.warning("Cannot check associated file '%s': %s", dst_item, e)
+                    stats.errors += 1
                     continue
             else:
                 # Target doesn't exist - create link (unless verify_only)
@@ -1160,12 +1523,25 @@ def process_movie(
                     # Nothing to verify if target doesn't exist
                     pass
                 elif dry_run:
-                    log.info("LINK   %s", item[1])
+                    log.info("LINK   %s", dst_item)
                     stats.asset_items_linked += 1
-                elif safe_hardlink(item[0], item[1]):
+                elif safe_hardlink(src_item, dst_item):
                     stats.asset_items_linked += 1
+                else:
+                    stats.errors += 1
             stats.asset_items_total += 1
 
+    for future in asset_folders:
+        stats.merge_from_asset(future.result())
+
+    # Failed or interrupted movies keep a differing mtime and are retried
+    if source_mtime_ns is not None and not dry_run and not stats.errors:
+        try:
+            target_stat = target_path.stat()
+            os.utime(target_path, ns=(target_stat.st_atime_ns, source_mtime_ns))
+        except OSError as e:
+            log.warning("Cannot update modification time of '%s': %s", target_path, e)
+
     return stats
 
 
@@ -1175,24 +1551,29 @@ def _scan_for_video_files(path: pathlib.Path, max_files: int = 100) -> Generator
     Limits scanning to max_files to prevent performance issues on large libraries.
     Uses breadth-first traversal to sample from multiple movie folders.
     """
+    video_suffixes = ACCEPTED_VIDEO_SUFFIXES
     files_found = 0
-    dirs_to_scan = [path]
+    # Plain path strings, a Path is only built for the files yielded
+    dirs_to_scan = deque([os.fspath(path)])
 
     while dirs_to_scan and files_found < max_files:
-        current_dir = dirs_to_scan.pop(0)
+        current_dir = dirs_to_scan.popleft()
         try:
             with os.scandir(current_dir) as entries:
                 for entry in entries:
                     if files_found >= max_files:
                         return
                     try:
-                        if entry.is_dir(follow_symlinks=False):
-                            dirs_to_scan.append(pathlib.Path(entry.path))
-                        elif entry.is_file(follow_symlinks=False):
-                            entry_path = pathlib.Path(entry.path)
-                            if entry_path.suffix.lower() in ACCEPTED_VIDEO_SUFFIXES:
-                                yield entry_path
-                                files_found += 1
+                        # Check the name first, only video candidates need
+                        # the file check
+                        if (
+                            _suffix_lower(entry.name) in video_suffixes
+                            and entry.is_file(follow_symlinks=False)
+                        ):
+                            yield pathlib.Path(entry.path)
+                            files_found += 1
+                        elif entry.is_dir(follow_symlinks=False):
+                            dirs_to_scan.append(entry.path)
                     except OSError:
                         # Skip entries we can't access
                         continue
@@ -1212,21 +1593,29 @@ def determine_library_type(path: pathlib.Path) -> type[MediaLibrary] | None:
 
     for entry in _scan_for_video_files(path, max_files=100):
         fname = entry.stem
-        # Check for provider id - definitive markers
-        if re.search(r"\[[a-z]+id-[^\]]+\]", fname, flags=re.IGNORECASE):
-            return JellyfinLibrary
-        if re.search(r"\{[a-z]+-[^\}]+\}", fname, flags=re.IGNORECASE):
-            return PlexLibrary
-        # Check for Plex edition - definitive marker
-        if re.search(r"\{edition-[^\}]+\}", fname, flags=re.IGNORECASE):
+        has_plex_id = has_resolution = has_tags = False
+        for match in LIBRARY_HINT_PATTERN.finditer(fname):
+            kind = match.lastgroup
+            # Check for provider id or Plex edition ({edition-...}) - definitive
+            # markers, a Jellyfin id takes precedence
+            if kind == "jellyfin_id":
+                return JellyfinLibrary
+            elif kind == "plex_id":
+                has_plex_id = True
+            elif kind == "resolution":
+                has_resolution = True
+            else:
+                has_tags = True
+        if has_plex_id:
             return PlexLibrary
         # Check for hints
         variant = fname.split(" - ")
-        if len(variant) > 1 and re.search(r"\(\d{4}\)", variant[-1]) is None:
+        if len(variant) > 1 and YEAR_HINT_PATTERN.search(variant[-1]) is None:
             jellyfin_hints += 1
-        if re.search(r"\[\d{3,4}[pi]\]", fname, flags=re.IGNORECASE):
-            plex_hints += 1
-        if re.search(r"\[[a-z0-9\.\,]+\]", fname, flags=re.IGNORECASE):
+        # A resolution counts as tags as well
+        if has_resolution:
+            plex_hints += 2
+        elif has_tags:
             plex_hints += 1
 
     if plex_hints > jellyfin_hints:
@@ -1252,7 +1641,12 @@ def sync(
     skip_verify: bool = False,
     mergerfs_branches: list[str] | None = None,
     check_colocation: bool = False,
+    max_workers: int = 1,
+    skip_unchanged: bool = False,
 ) -> int:
+    if max_workers < 1:
+        raise ValueError("Parameter 'max_workers' must be at least 1")
+
     if debug:
         logging.getLogger().setLevel(logging.DEBUG)
 
@@ -1286,7 +1680,9 @@ def sync(
             target_lib.shortname().capitalize(),
         )
 
-    if not source_lib.base_dir.is_dir():
+    # The stat results are reused by the filesystem check below
+    source_stat = _dir_stat(source_lib.base_dir)
+    if source_stat is None:
         log.error("Source directory '%s' does not exist", source_lib.base_dir)
         return 1
 
@@ -1301,15 +1697,19 @@ def sync(
         )
         return 1
 
-    if not target_lib.base_dir.is_dir():
+    target_stat = _dir_stat(target_lib.base_dir)
+    if target_stat is None:
         if create:
             target_lib.base_dir.mkdir(parents=True)
+            target_stat = target_lib.base_dir.stat()
         else:
             log.error("Target directory '%s' does not exist", target_lib.base_dir)
             return 1
 
     # Check if source and target are on the same filesystem (required for hard links)
-    same_fs, is_mergerfs = are_same_filesystem(source_lib.base_dir, target_lib.base_dir)
+    same_fs, is_mergerfs = are_same_filesystem(
+        source_lib.base_dir, target_lib.base_dir, stat1=source_stat, stat2=target_stat
+    )
     if not same_fs:
         if is_mergerfs:
             log.error(
@@ -1348,66 +1748,84 @@ def sync(
         log.info("VERIFY-ONLY mode: Checking existing hard links without making changes")
 
     stat_movies: int = 0
-    stat_items_linked: int = 0
-    stat_items_removed: int = 0
-    stat_links_verified: int = 0
-    stat_links_broken: int = 0
-    stat_links_repaired: int = 0
+    totals = MovieStats()
     lib_stats = LibraryStats()
 
-    if partial_path:
-        # Partial sync logic
-        movie_folder = resolve_movie_folder(source_lib, partial_path)
-        if not movie_folder:
-            log.error(f"Could not resolve movie folder for partial path: {partial_path}")
-            return 1
-
-        movie_info = source_lib.parse_movie_path(movie_folder)
-        if not movie_info:
-            log.warning(f"Could not parse movie info from folder: {movie_folder}")
-            # We skip this as we cannot process it without parsed info
-            return 1
+    # Movies (or with --delete, asset subfolders) are processed by a thread
+    # pool when more than one worker is requested, hiding the latency of
+    # network and FUSE mounts
+    executor = ThreadPoolExecutor(max_workers=max_workers) if max_workers > 1 else None
+    try:
+        if partial_path:
+            # Partial sync logic
+            movie_folder = resolve_movie_folder(source_lib, partial_path)
+            if not movie_folder:
+                log.error(f"Could not resolve movie folder for partial path: {partial_path}")
+                return 1
+
+            movie_info = source_lib.parse_movie_path(movie_folder)
+            if not movie_info:
+                log.warning(f"Could not parse movie info from folder: {movie_folder}")
+                # We skip this as we cannot process it without parsed info
+                return 1
+            else:
+                s = process_movie(
+                    source_lib,
+                    target_lib,
+                    movie_folder,
+                    movie_info,
+                    delete=delete,
+                    verbose=verbose,
+                    dry_run=dry_run,
+                    update_filenames=update_filenames,
+                    verify_only=verify_only,
+                    skip_verify=skip_verify,
+                    skip_unchanged=skip_unchanged,
+                    executor=executor,
+                )
+                stat_movies += 1
+                totals.merge(s)
         else:
-            s = process_movie(
+            process = functools.partial(
+                process_movie,
                 source_lib,
                 target_lib,
-                movie_folder,
-                movie_info,
                 delete=delete,
                 verbose=verbose,
                 dry_run=dry_run,
                 update_filenames=update_filenames,
                 verify_only=verify_only,
                 skip_verify=skip_verify,
+                skip_unchanged=skip_unchanged,
             )
-            stat_movies += 1
-            stat_items_linked += s.asset_items_linked + s.videos_linked
-            stat_items_removed += s.asset_items_removed + s.items_removed
-            stat_links_verified += s.links_verified
-            stat_links_broken += s.links_broken
-            stat_links_repaired += s.links_repaired
-    else:
-        for src, _, movie in scan_media_library(source_lib, target_lib, delete=delete, dry_run=dry_run, stats=lib_stats):
-            s = process_movie(
-                source_lib,
-                target_lib,
-                src,
-                movie,
-                delete=delete,
-                verbose=verbose,
-                dry_run=dry_run,
-                update_filenames=update_filenames,
-                verify_only=verify_only,
-                skip_verify=skip_verify,
-            )
-            stat_movies += 1
-            stat_items_linked += s.asset_items_linked + s.videos_linked
-            stat_items_removed += s.asset_items_removed + s.items_removed
-            stat_links_verified += s.links_verified
-            stat_links_broken += s.links_broken
-            stat_links_repaired += s.links_repaired
-
-        stat_items_removed += lib_stats.items_removed
+            movies = scan_media_library(source_lib, target_lib, delete=delete, dry_run=dry_run, stats=lib_stats)
+            if executor and not delete:
+                # Movies are independent of each other: process them in the
+                # pool, their asset folders are handled serially by the worker.
+                # With --delete movies stay serial, in library order.
+                futures = [executor.submit(process, src, movie) for src, _, movie in movies]
+                results = (future.result() for future in futures)
+            else:
+                results = (process(src, movie, executor=executor) for src, _, movie in movies)
+
+            for s in results:
+                stat_movies += 1
+                totals.merge(s)
+    except BaseException:
+        # Drop the queued movies on errors and interrupts instead of
+        # waiting for the rest of the library to be processed
+        if executor:
+            executor.shutdown(cancel_futures=True)
+        raise
+    finally:
+        if executor:
+            executor.shutdown()
+
+    stat_items_linked = totals.asset_items_linked + totals.videos_linked
+    stat_items_removed = totals.asset_items_removed + totals.items_removed + lib_stats.items_removed
+    stat_links_verified = totals.links_verified
+    stat_links_broken = totals.links_broken
+    stat_links_repaired = totals.links_repaired
 
     # Build summary message
     if verify_only:
@@ -1460,8 +1878,12 @@ if __name__ == "__main__":
     parser.add_argument("--skip-verify", action="store_true", help="Skip inode verification for existing files")
     parser.add_argument("--mergerfs-branches", nargs="+", help="List of MergerFS branches for validation")
     parser.add_argument("--check-colocation", action="store_true", help="Check if source/target are colocated")
+    parser.add_argument("--max-workers", type=int, default=1, help="Worker threads for movies (asset subfolders with --delete)")
+    parser.add_argument("--skip-unchanged", action="store_true", help="Skip movie folders unchanged since their last sync")
 
     args = parser.parse_args()
+    if args.max_workers < 1:
+        parser.error("--max-workers must be at least 1")
 
     sys.exit(sync(
         args.source,
@@ -1478,4 +1900,6 @@ if __name__ == "__main__":
         skip_verify=args.skip_verify,
         mergerfs_branches=args.mergerfs_branches,
         check_colocation=args.check_colocation,
+        max_workers=args.max_workers,
+        skip_unchanged=args.skip_unchanged,
     ))
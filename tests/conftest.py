@@ -0,0 +1,8 @@
+import importlib
+import pytest
+
+
+@pytest.fixture
+def sync_module():
+    # jellyplex.sync is shadowed by the sync() function re-exported in the package
+    return importlib.import_module("jellyplex.sync")
@@ -0,0 +1,87 @@
+from pathlib import Path
+import pytest
+
+import jellyplex as jp
+
+
+def make_library(base: Path, files: list[str]) -> Path:
+    for name in files:
+        path = base / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+    return base
+
+
+SAMPLES = [
+    (
+        ["Das Boot (1981) [imdbid-tt0082096]/Das Boot (1981) [imdbid-tt0082096].mkv"],
+        jp.JellyfinLibrary,
+    ),
+    (
+        ["Das Boot (1981) {imdb-tt0082096}/Das Boot (1981) {imdb-tt0082096}.mkv"],
+        jp.PlexLibrary,
+    ),
+    (
+        ["Das Boot (1981)/Das Boot (1981) {edition-Director's Cut}.mkv"],
+        jp.PlexLibrary,
+    ),
+    (
+        [
+            "Das Boot (1981)/Das Boot (1981) [1080p].mkv",
+            "Das Boot (1981)/Das Boot (1981) - Director's Cut.mkv",
+        ],
+        jp.PlexLibrary,
+    ),
+    (
+        [
+            "Das Boot (1981)/Das Boot (1981) - Director's Cut.mkv",
+            "Das Boot (1981)/Das Boot (1981) - Theatrical Cut.mkv",
+        ],
+        jp.JellyfinLibrary,
+    ),
+    (
+        ["Das Boot (1981)/Das Boot (1981) {imdb-tt0082096} [imdbid-tt0082096].mkv"],
+        jp.JellyfinLibrary,
+    ),
+    (
+        # A resolution counts as a tag as well
+        [
+            "Das Boot (1981)/Das Boot (1981) - Director's Cut.mkv",
+            "Das Boot (1981)/Das Boot (1981) - Theatrical Cut.mkv",
+            "Alien (1979)/Alien (1979) [2160p].mkv",
+        ],
+        None,
+    ),
+    (
+        [
+            "Das Boot (1981)/Das Boot (1981) - Director's Cut.mkv",
+            "Das Boot (1981)/Das Boot (1981) - Theatrical Cut.mkv",
+            "Alien (1979)/Alien (1979) [HDR].mkv",
+        ],
+        jp.JellyfinLibrary,
+    ),
+    (
+        # A Jellyfin id decides, however many Plex hints the other files give
+        [
+            "Alien (1979)/Alien (1979) [1080p].mkv",
+            "Aliens (1986)/Aliens (1986) [1080p].mkv",
+            "Alien 3 (1992)/Alien 3 (1992) [1080p].mkv",
+            "Das Boot (1981) [imdbid-tt0082096]/Das Boot (1981) [imdbid-tt0082096].mkv",
+        ],
+        jp.JellyfinLibrary,
+    ),
+    (
+        ["Das Boot (1981)/Das Boot (1981).mkv"],
+        None,
+    ),
+]
+
+
+@pytest.mark.parametrize("files, expected", SAMPLES)
+def test_determine_library_type(tmp_path: Path, files: list[str], expected, sync_module):
+    assert sync_module.determine_library_type(make_library(tmp_path, files)) is expected
+
+
+def test_determine_library_type_ignores_non_video_files(tmp_path: Path, sync_module):
+    make_library(tmp_path, ["Das Boot (1981)/Das Boot (1981) [imdbid-tt0082096].srt"])
+    assert sync_module.determine_library_type(tmp_path) is None
@@ -0,0 +1,154 @@
+import errno
+import os
+from pathlib import Path
+import pytest
+
+
+MOUNTINFO = """\
+22 1 8:1 / / rw,relatime shared:1 - ext4 /dev/sda1 rw
+40 22 0:45 / /mnt/storage rw,relatime shared:20 - fuse.mergerfs disk1:disk2 rw,user_id=0
+41 22 0:46 / /mnt/legacy rw,relatime - fuse mergerfs rw,user_id=0
+42 22 0:47 / /mnt/sshfs rw,relatime - fuse.sshfs host:/ rw
+garbage line
+"""
+
+
+@pytest.fixture
+def mountinfo(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, sync_module) -> Path:
+    path = tmp_path / "mountinfo"
+    path.write_text(MOUNTINFO)
+    monkeypatch.setattr(sync_module, "MOUNTINFO_PATH", str(path))
+    sync_module._scan_mounts.cache_clear()
+    yield path
+    sync_module._scan_mounts.cache_clear()
+
+
+def test_scan_mounts(mountinfo: Path, sync_module):
+    assert sync_module._scan_mounts() == {
+        os.makedev(8, 1): False,
+        os.makedev(0, 45): True,
+        os.makedev(0, 46): True,
+        os.makedev(0, 47): False,
+    }
+
+
+def test_scan_mounts_without_mountinfo(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, sync_module):
+    monkeypatch.setattr(sync_module, "MOUNTINFO_PATH", str(tmp_path / "missing"))
+    sync_module._scan_mounts.cache_clear()
+    try:
+        assert sync_module._scan_mounts() == {}
+    finally:
+        sync_module._scan_mounts.cache_clear()
+
+
+@pytest.fixture
+def fake_mergerfs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, sync_module) -> list[tuple[str, bytes]]:
+    """Pretend that everything below tmp_path/merged is on MergerFS branch /mnt/disk1."""
+    if not sync_module._XATTR_AVAILABLE:
+        pytest.skip("os.getxattr not available")
+    calls: list[tuple[str, bytes]] = []
+    merged = str(tmp_path / "merged")
+
+    def getxattr(path, name):
+        path = str(path)
+        calls.append((path, name))
+        if not os.path.exists(path):
+            raise FileNotFoundError(path)
+        if not path.startswith(merged):
+            raise OSError(errno.ENODATA, "No data available")
+        values = {
+            sync_module.MERGERFS_XATTR_BASEPATH: "/mnt/disk1",
+            sync_module.MERGERFS_XATTR_RELPATH: path[len(merged):],
+            sync_module.MERGERFS_XATTR_FULLPATH: "/mnt/disk1" + path[len(merged):],
+        }
+        return values[name].encode() + b"\x00"
+
+    monkeypatch.setattr(os, "getxattr", getxattr)
+    monkeypatch.setattr(sync_module, "_scan_mounts", lambda: {})
+    monkeypatch.setattr(sync_module, "_MOUNT_IS_MERGERFS", {})
+    monkeypatch.setattr(sync_module, "_MERGERFS_ATTR_CACHE", {})
+    (tmp_path / "merged").mkdir()
+    return calls
+
+
+def test_get_mergerfs_info(tmp_path: Path, fake_mergerfs, sync_module):
+    movie = tmp_path / "merged" / "movie.mkv"
+    movie.touch()
+
+    assert sync_module.get_mergerfs_info(movie) == ("/mnt/disk1", "/movie.mkv")
+    assert sync_module.get_mergerfs_branch(movie) == "/mnt/disk1"
+    assert sync_module.get_mergerfs_fullpath(movie) == "/mnt/disk1/movie.mkv"
+    # Missing paths are reported as not available
+    assert sync_module.get_mergerfs_info(tmp_path / "merged" / "missing") == (None, None)
+
+
+def test_mergerfs_attributes_are_cached(tmp_path: Path, fake_mergerfs, sync_module):
+    movie = tmp_path / "merged" / "movie.mkv"
+    movie.touch()
+
+    sync_module.get_mergerfs_branch(movie)
+    sync_module.get_mergerfs_branch(movie)
+    assert len(fake_mergerfs) == 1
+
+    sync_module._forget_mergerfs_path(movie)
+    sync_module.get_mergerfs_branch(movie)
+    assert len(fake_mergerfs) == 2
+
+
+def test_non_mergerfs_device_skips_probe(tmp_path: Path, fake_mergerfs, sync_module):
+    first = tmp_path / "first.mkv"
+    second = tmp_path / "second.mkv"
+    first.touch()
+    second.touch()
+
+    assert sync_module.get_mergerfs_branch(first) is None
+    assert sync_module.get_mergerfs_branch(second) is None
+    # Only the first lookup on the device reaches getxattr
+    assert fake_mergerfs == [(str(first), sync_module.MERGERFS_XATTR_BASEPATH)]
+
+
+def test_direct_branch_path_warning(tmp_path: Path, caplog: pytest.LogCaptureFixture, sync_module):
+    disk = tmp_path / "disk1"
+    source = disk / "movies"
+    target = disk / "plex"
+    source.mkdir(parents=True)
+    target.mkdir()
+
+    assert sync_module.are_same_filesystem(source, target, [str(tmp_path / "disk")]) == (True, False)
+    assert "Direct branch path detected" not in caplog.text
+    assert sync_module.are_same_filesystem(source, target, [f"{disk}/"]) == (True, False)
+    assert "Direct branch path detected" in caplog.text
+
+
+def test_verify_hardlink_on_non_mergerfs_device(tmp_path: Path, fake_mergerfs, sync_module):
+    source = tmp_path / "source.mkv"
+    source.write_text("data")
+    link = tmp_path / "link.mkv"
+    link.hardlink_to(source)
+    copy = tmp_path / "copy.mkv"
+    copy.write_text("data")
+    sync_module._MOUNT_IS_MERGERFS[source.stat().st_dev] = False
+
+    assert sync_module.verify_hardlink(source, link)
+    assert not sync_module.verify_hardlink(source, copy)
+    assert fake_mergerfs == []
+
+
+def test_failed_probe_does_not_override_mountinfo(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, sync_module):
+    if not sync_module._XATTR_AVAILABLE:
+        pytest.skip("os.getxattr not available")
+    movie = tmp_path / "movie.mkv"
+    movie.touch()
+    device = movie.stat().st_dev
+
+    def getxattr(path, name):
+        raise OSError(errno.ENODATA, "No data available")
+
+    monkeypatch.setattr(os, "getxattr", getxattr)
+    monkeypatch.setattr(sync_module, "_scan_mounts", lambda: {device: True})
+    monkeypatch.setattr(sync_module, "_MOUNT_IS_MERGERFS", {})
+    monkeypatch.setattr(sync_module, "_MERGERFS_ATTR_CACHE", {})
+
+    assert sync_module.get_mergerfs_branch(movie) is None
+    # Mountinfo still classifies the device as MergerFS
+    assert sync_module._is_mergerfs_device(device) is True
@@ -0,0 +1,272 @@
+import os
+from pathlib import Path
+import threading
+import time
+import pytest
+
+import jellyplex as jp
+
+
+MOVIE = "Das Boot (1981) [imdbid-tt0082096]"
+VIDEO = f"{MOVIE} - Director's Cut.mkv"
+
+PLEX_MOVIE = "Das Boot (1981) {imdb-tt0082096}"
+PLEX_VIDEO = f"{PLEX_MOVIE} {{edition-Director's Cut}}.mkv"
+
+
+def write(path: Path, content: str = "data") -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    return path
+
+
+def same_file(a: Path, b: Path) -> bool:
+    return a.stat().st_ino == b.stat().st_ino
+
+
+@pytest.fixture
+def source(tmp_path: Path) -> Path:
+    base = tmp_path / "jellyfin"
+    write(base / MOVIE / VIDEO)
+    write(base / MOVIE / f"{MOVIE} - Director's Cut.en.srt")
+    write(base / MOVIE / "extras" / "Making of.mkv")
+    write(base / MOVIE / "extras" / "empty.nfo", "")
+    return base
+
+
+@pytest.fixture
+def target(tmp_path: Path) -> Path:
+    base = tmp_path / "plex"
+    base.mkdir()
+    return base
+
+
+def run_sync(source: Path, target: Path, **kwargs) -> int:
+    return jp.sync(str(source), str(target), convert_to="plex", **kwargs)
+
+
+def test_sync_creates_hardlinks(source: Path, target: Path):
+    assert run_sync(source, target) == 0
+
+    movie = target / PLEX_MOVIE
+    assert same_file(movie / PLEX_VIDEO, source / MOVIE / VIDEO)
+    assert same_file(
+        movie / f"{PLEX_MOVIE} {{edition-Director's Cut}}.en.srt",
+        source / MOVIE / f"{MOVIE} - Director's Cut.en.srt",
+    )
+    assert same_file(movie / "extras" / "Making of.mkv", source / MOVIE / "extras" / "Making of.mkv")
+    # Zero-byte files are skipped
+    assert not (movie / "extras" / "empty.nfo").exists()
+
+
+def test_sync_is_idempotent(source: Path, target: Path):
+    assert run_sync(source, target) == 0
+    before = sorted(p.relative_to(target) for p in target.rglob("*"))
+    assert run_sync(source, target, delete=True) == 0
+    assert sorted(p.relative_to(target) for p in target.rglob("*")) == before
+
+
+def test_dry_run_changes_nothing(source: Path, target: Path):
+    assert run_sync(source, target, dry_run=True) == 0
+    assert list(target.iterdir()) == []
+
+
+def test_delete_removes_stray_items(source: Path, target: Path):
+    assert run_sync(source, target) == 0
+    write(target / "Stray movie (2000)" / "Stray movie (2000).mkv")
+    write(target / PLEX_MOVIE / "stray.txt")
+    write(target / PLEX_MOVIE / "extras" / "stray.mkv")
+
+    assert run_sync(source, target) == 0
+    assert (target / "Stray movie (2000)").exists()
+    assert (target / PLEX_MOVIE / "stray.txt").exists()
+
+    assert run_sync(source, target, delete=True) == 0
+    assert not (target / "Stray movie (2000)").exists()
+    assert not (target / PLEX_MOVIE / "stray.txt").exists()
+    assert not (target / PLEX_MOVIE / "extras" / "stray.mkv").exists()
+    assert (target / PLEX_MOVIE / PLEX_VIDEO).exists()
+
+
+def test_copies_are_relinked(source: Path, target: Path):
+    write(target / PLEX_MOVIE / PLEX_VIDEO, "copy")
+    write(target / PLEX_MOVIE / "extras" / "Making of.mkv", "copy")
+
+    assert run_sync(source, target) == 0
+    assert same_file(target / PLEX_MOVIE / PLEX_VIDEO, source / MOVIE / VIDEO)
+    assert same_file(target / PLEX_MOVIE / "extras" / "Making of.mkv", source / MOVIE / "extras" / "Making of.mkv")
+
+
+def test_verify_only_changes_nothing(source: Path, target: Path):
+    write(target / PLEX_MOVIE / PLEX_VIDEO, "copy")
+
+    assert run_sync(source, target, verify_only=True) == 0
+    assert not same_file(target / PLEX_MOVIE / PLEX_VIDEO, source / MOVIE / VIDEO)
+    assert not (target / PLEX_MOVIE / "extras").exists()
+
+
+def test_stale_link_is_renamed_with_update_filenames(source: Path, target: Path):
+    stale = target / PLEX_MOVIE / f"{PLEX_MOVIE}.mkv"
+    stale.parent.mkdir(parents=True)
+    stale.hardlink_to(source / MOVIE / VIDEO)
+    write(target / PLEX_MOVIE / f"{PLEX_MOVIE}.en.srt")
+
+    assert run_sync(source, target, update_filenames=True, delete=True) == 0
+    assert not stale.exists()
+    assert not (target / PLEX_MOVIE / f"{PLEX_MOVIE}.en.srt").exists()
+    assert same_file(target / PLEX_MOVIE / PLEX_VIDEO, source / MOVIE / VIDEO)
+
+
+def test_stale_link_is_preserved_without_update_filenames(source: Path, target: Path):
+    # Same edition, outdated name
+    stale_movie = "Das Boot (1981) {edition-Director's Cut}"
+    stale = target / PLEX_MOVIE / f"{stale_movie}.mkv"
+    stale.parent.mkdir(parents=True)
+    stale.hardlink_to(source / MOVIE / VIDEO)
+    write(target / PLEX_MOVIE / f"{stale_movie}.en.srt")
+
+    assert run_sync(source, target, delete=True) == 0
+    assert stale.exists()
+    assert (target / PLEX_MOVIE / f"{stale_movie}.en.srt").exists()
+    assert not (target / PLEX_MOVIE / PLEX_VIDEO).exists()
+
+
+def test_stale_link_with_other_edition_is_replaced(source: Path, target: Path):
+    stale = target / PLEX_MOVIE / f"{PLEX_MOVIE}.mkv"
+    stale.parent.mkdir(parents=True)
+    stale.hardlink_to(source / MOVIE / VIDEO)
+
+    assert run_sync(source, target, delete=True) == 0
+    assert not stale.exists()
+    assert same_file(target / PLEX_MOVIE / PLEX_VIDEO, source / MOVIE / VIDEO)
+
+
+def test_partial_sync(source: Path, target: Path):
+    write(source / "Other movie (2000)" / "Other movie (2000).mkv")
+
+    assert run_sync(source, target, partial_path=str(source / MOVIE)) == 0
+    assert (target / PLEX_MOVIE / PLEX_VIDEO).exists()
+    assert not (target / "Other movie (2000)").exists()
+
+
+def test_sync_with_worker_threads(source: Path, target: Path):
+    write(source / MOVIE / "extras" / "Interviews" / "Cast.mkv")
+    write(source / MOVIE / "featurettes" / "Trailer.mkv")
+
+    assert run_sync(source, target, max_workers=4) == 0
+    movie = target / PLEX_MOVIE
+    assert same_file(movie / PLEX_VIDEO, source / MOVIE / VIDEO)
+    assert same_file(movie / "extras" / "Interviews" / "Cast.mkv", source / MOVIE / "extras" / "Interviews" / "Cast.mkv")
+    assert same_file(movie / "featurettes" / "Trailer.mkv", source / MOVIE / "featurettes" / "Trailer.mkv")
+
+
+def test_sync_movies_with_worker_threads(source: Path, target: Path):
+    others = [f"Other movie {n} (2000)" for n in range(5)]
+    for other in others:
+        write(source / other / f"{other}.mkv")
+    write(target / "Stray movie (2000)" / "Stray movie (2000).mkv")
+
+    assert run_sync(source, target, max_workers=4) == 0
+    for other in others:
+        assert same_file(target / other / f"{other}.mkv", source / other / f"{other}.mkv")
+    assert (target / "Stray movie (2000)").exists()
+
+    assert run_sync(source, target, max_workers=4, delete=True) == 0
+    assert not (target / "Stray movie (2000)").exists()
+    assert (target / PLEX_MOVIE / PLEX_VIDEO).exists()
+
+
+def test_conflicting_movie_folders_are_not_synced(source: Path, target: Path, caplog: pytest.LogCaptureFixture):
+    write(source / f"{MOVIE} [tmdbid-387]" / VIDEO)
+
+    assert run_sync(source, target) == 0
+    assert "Conflicting folders" in caplog.text
+    assert list(target.iterdir()) == []
+
+
+def test_skip_unchanged(source: Path, target: Path):
+    assert run_sync(source, target, skip_unchanged=True) == 0
+    movie = target / PLEX_MOVIE
+    # The synced target folder carries the modification time of the source folder
+    assert movie.stat().st_mtime_ns == (source / MOVIE).stat().st_mtime_ns
+
+    # Changes inside subfolders are not detected
+    (movie / "extras" / "Making of.mkv").unlink()
+    assert run_sync(source, target, skip_unchanged=True) == 0
+    assert not (movie / "extras" / "Making of.mkv").exists()
+
+    # Adding a file changes the modification time of the source folder
+    write(source / MOVIE / f"{MOVIE} - Director's Cut.de.srt")
+    mtime_ns = movie.stat().st_mtime_ns + 1_000_000_000
+    os.utime(source / MOVIE, ns=(mtime_ns, mtime_ns))
+    assert run_sync(source, target, skip_unchanged=True) == 0
+    assert (movie / "extras" / "Making of.mkv").exists()
+    assert (movie / f"{PLEX_MOVIE} {{edition-Director's Cut}}.de.srt").exists()
+
+
+def test_skip_unchanged_retries_failed_links(source: Path, target: Path, monkeypatch: pytest.MonkeyPatch, sync_module):
+    with monkeypatch.context() as m:
+        m.setattr(sync_module, "safe_hardlink", lambda source, target: False)
+        assert run_sync(source, target, skip_unchanged=True) == 0
+    assert not (target / PLEX_MOVIE / PLEX_VIDEO).exists()
+
+    assert run_sync(source, target, skip_unchanged=True) == 0
+    assert same_file(target / PLEX_MOVIE / PLEX_VIDEO, source / MOVIE / VIDEO)
+
+
+def test_zero_byte_and_symlinked_associated_files_are_skipped(source: Path, target: Path):
+    write(source / MOVIE / f"{MOVIE} - Director's Cut.nfo", "")
+    (source / MOVIE / f"{MOVIE} - Director's Cut.de.srt").symlink_to(f"{MOVIE} - Director's Cut.en.srt")
+
+    assert run_sync(source, target) == 0
+    movie = target / PLEX_MOVIE
+    assert (movie / f"{PLEX_MOVIE} {{edition-Director's Cut}}.en.srt").exists()
+    assert not (movie / f"{PLEX_MOVIE} {{edition-Director's Cut}}.nfo").exists()
+    assert not (movie / f"{PLEX_MOVIE} {{edition-Director's Cut}}.de.srt").exists()
+
+
+def test_worker_threads_stop_on_error(source: Path, target: Path, monkeypatch: pytest.MonkeyPatch, sync_module):
+    for n in range(20):
+        write(source / f"Other movie {n} (2000)" / f"Other movie {n} (2000).mkv")
+    processed = []
+    lock = threading.Lock()
+
+    def process_movie(*args, **kwargs):
+        with lock:
+            processed.append(args)
+            if len(processed) == 1:
+                raise RuntimeError("failed")
+        time.sleep(0.05)
+        return sync_module.MovieStats()
+
+    monkeypatch.setattr(sync_module, "process_movie", process_movie)
+    with pytest.raises(RuntimeError):
+        run_sync(source, target, max_workers=2)
+    # Queued movies are not processed after the error
+    assert len(processed) < 21
+
+
+def test_dangling_symlink_video_target(source: Path, target: Path):
+    (target / PLEX_MOVIE).mkdir()
+    (target / PLEX_MOVIE / PLEX_VIDEO).symlink_to(target / "missing.mkv")
+
+    # The link cannot be created, but the rest of the movie is synced
+    assert run_sync(source, target) == 0
+    assert (target / PLEX_MOVIE / PLEX_VIDEO).is_symlink()
+    assert same_file(target / PLEX_MOVIE / "extras" / "Making of.mkv", source / MOVIE / "extras" / "Making of.mkv")
+
+
+def test_asset_folders_use_worker_threads_with_delete(source: Path, target: Path, monkeypatch: pytest.MonkeyPatch, sync_module):
+    write(source / MOVIE / "featurettes" / "Trailer.mkv")
+    threads = []
+    process_assets_folder = sync_module.process_assets_folder
+
+    def probe(*args, **kwargs):
+        threads.append(threading.current_thread())
+        return process_assets_folder(*args, **kwargs)
+
+    monkeypatch.setattr(sync_module, "process_assets_folder", probe)
+    assert run_sync(source, target, max_workers=2, delete=True) == 0
+    assert len(threads) == 2
+    assert threading.main_thread() not in threads
+    assert same_file(target / PLEX_MOVIE / "featurettes" / "Trailer.mkv", source / MOVIE / "featurettes" / "Trailer.mkv")